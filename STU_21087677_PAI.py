@@ -12,6 +12,7 @@ ELITE_SIZE = 2          # Top solutions kept unchanged - keeps the best ideas
 TOURNAMENT_SIZE = 5     # Solutions compared in selection - fair competition size
 MUTATION_RATE = 0.15     # Chance of random change - adds variety without chaos
 MAX_HOURS_PER_EMPLOYEE = 40  # Max hours per employee - matches real-world work limits
+PLANNING_WEEKS = 13     # Weeks in the multi-period plan - one quarter
 
 # Data class holding project and employee info
 class Data:
@@ -73,6 +74,41 @@ class Data:
     # EMPLOYEES_15: Combines EMPLOYEES_10 and MORE_EMPLOYEES for a total of 15 employees
     EMPLOYEES_15 = EMPLOYEES_10 + MORE_EMPLOYEES
 
+    # PROJECTS_QUARTER: The 15 projects planned over a quarter (PLANNING_WEEKS = 13)
+    # Format: [name, required skills, total hours needed, priority, first week, last week]
+    # - total hours needed (int): Hours over the whole window, shared by the team across its weeks
+    # - first week / last week (int): Window the project can be worked on (1 to 13, inclusive)
+    PROJECTS_QUARTER = [
+        ["P1", ["Python", "Database"], 120, 2, 1, 4],            # P1: 120 hours across weeks 1-4
+        ["P2", ["Java", "Networking"], 60, 1, 2, 3],             # P2: Short job, weeks 2-3
+        ["P3", ["Python", "Machine Learning"], 200, 3, 1, 8],    # P3: Big and important, weeks 1-8
+        ["P4", ["Database", "Java"], 60, 1, 5, 6],               # P4: Short job, weeks 5-6
+        ["P5", ["Networking", "Machine Learning"], 120, 2, 4, 7], # P5: Weeks 4-7
+        ["P6", ["AI", "Cloud"], 160, 2, 3, 8],                   # P6: Weeks 3-8
+        ["P7", ["Cybersecurity", "Networking"], 100, 1, 6, 9],   # P7: Weeks 6-9
+        ["P8", ["Python", "AI"], 180, 2, 7, 12],                 # P8: Weeks 7-12
+        ["P9", ["Data Science", "Machine Learning"], 240, 3, 5, 13], # P9: Big and important, weeks 5-13
+        ["P10", ["Java", "Database"], 120, 1, 9, 12],            # P10: Weeks 9-12
+        ["P11", ["Python", "Cloud"], 160, 2, 10, 13],            # P11: Weeks 10-13
+        ["P12", ["Java", "Cybersecurity"], 100, 2, 8, 11],       # P12: Weeks 8-11
+        ["P13", ["Networking", "Data Science"], 120, 2, 11, 13], # P13: Weeks 11-13
+        ["P14", ["AI", "Database"], 140, 2, 1, 5],               # P14: Weeks 1-5
+        ["P15", ["Machine Learning", "Cloud"], 240, 3, 6, 13]    # P15: Big and important, weeks 6-13
+    ]
+
+    # CAPACITY_CHANGES: Weeks where an employee can't work their usual emp[3] hours
+    # Format: {(employee ID, week): hours available that week}
+    # Only the exceptions are stored (holidays, training...) - every other week uses emp[3]
+    CAPACITY_CHANGES = {
+        ("E1", 7): 0, ("E1", 8): 0,      # Alice on holiday weeks 7-8
+        ("E3", 1): 10,                   # Charlie half-time in week 1
+        ("E5", 12): 0, ("E5", 13): 0,    # Eve on holiday weeks 12-13
+        ("E7", 5): 20,                   # Grace on training in week 5
+        ("E10", 4): 20,                  # Judy half-time in week 4
+        ("E12", 9): 0,                   # Laura off in week 9
+        ("E14", 10): 0, ("E14", 11): 0   # Nina on holiday weeks 10-11
+    }
+
 
 # Function: Makes a lookup table to find employees by skill
 # Purpose: Helps us quickly see which employees have a certain skill - like a phonebook!
@@ -568,6 +604,341 @@ def summarize_scenario(scenario_name, params, projects, employees, skill_map, ru
     # Return all the results in case we need them later
     return results
 
+# ---------------------------------------------------------------------------
+# Multi-period (quarter) allocation
+# The functions above plan a single week. The ones below plan PLANNING_WEEKS weeks at once.
+# A plan is a SPARSE dictionary: {(emp_idx, proj_idx, week): hours}
+# Only assignments that really exist are stored - an employee who never touches P3 costs nothing,
+# so memory and scoring time grow with the number of assignments, not employees x projects x weeks.
+# ---------------------------------------------------------------------------
+
+# Function: Makes a lookup of which employees can work on each project
+# Purpose: Same idea as the skill map, but per project - so we never re-check skills gene by gene
+def create_project_team_mapping(projects, skill_to_employees):
+    # One set per project (e.g., project_teams[0] = {2, 5, 7} for P1)
+    project_teams = []
+    for proj in projects:
+        # Anyone with at least one of the required skills can help
+        valid_employees = set()
+        for skill in proj[1]:
+            valid_employees.update(skill_to_employees.get(skill, []))
+        project_teams.append(valid_employees)
+    return project_teams
+
+
+# Function: Finds how many hours an employee can work in a given week
+# Purpose: Uses their usual emp[3] hours unless CAPACITY_CHANGES says otherwise (holiday, training...)
+def weekly_capacity(emp_idx, week, employees, capacity_changes):
+    # Dictionary lookup - only exceptions are stored, so most weeks fall back to emp[3]
+    return capacity_changes.get((employees[emp_idx][0], week), employees[emp_idx][3])
+
+
+# Function: Adds up the hours already booked per (employee, week) in a plan
+# Purpose: Tells plan_project how much room each employee has left, skipping one project if asked
+def booked_hours(plan, skip_proj_idx=None):
+    booked = {}
+    for (emp_idx, proj_idx, week), hours in plan.items():
+        if proj_idx != skip_proj_idx:
+            booked[(emp_idx, week)] = booked.get((emp_idx, week), 0) + hours
+    return booked
+
+
+# Function: Spreads one project's hours over its team and some of its weeks
+# Purpose: Builds the genes for a single project - who works on it, which weeks, how many hours each
+def plan_project(proj_idx, projects, employees, capacity_changes, project_teams, booked):
+    # Project details: total hours and the window of weeks it can run in
+    project = projects[proj_idx]
+    required_hours, first_week, last_week = project[2], project[4], project[5]
+
+    genes = {}
+    valid_employees = list(project_teams[proj_idx])
+    if not valid_employees:
+        return genes
+
+    # Pick 1 to 3 employees, like the single-week version
+    k = min(len(valid_employees), random.randint(1, 3))
+    team = random.sample(valid_employees, k)
+
+    # Room each team member has left in a week (their capacity minus hours already booked)
+    def room(emp_idx, week):
+        return max(0, weekly_capacity(emp_idx, week, employees, capacity_changes) - booked.get((emp_idx, week), 0))
+
+    # Pick a random run of weeks inside the window - short and intense or long and light
+    span = random.randint(1, last_week - first_week + 1)
+    start = random.randint(first_week, last_week - span + 1)
+    end = start + span - 1
+
+    # Stretch the run one week at a time until the team has enough room (or the window is full)
+    total_room = sum(room(emp_idx, week) for week in range(start, end + 1) for emp_idx in team)
+    while total_room < required_hours and (start > first_week or end < last_week):
+        if end == last_week or (start > first_week and random.random() < 0.5):
+            start -= 1
+            total_room += sum(room(emp_idx, start) for emp_idx in team)
+        else:
+            end += 1
+            total_room += sum(room(emp_idx, end) for emp_idx in team)
+
+    # Slots where someone can work: skips holidays and weeks that are already full
+    slots = [(emp_idx, week, room(emp_idx, week)) for week in range(start, end + 1) for emp_idx in team]
+    slots = [slot for slot in slots if slot[2] > 0]
+    if sum(slot[2] for slot in slots) < required_hours:
+        # Not enough free room - fall back to full weekly capacity (still no holiday work)
+        slots = [(emp_idx, week, weekly_capacity(emp_idx, week, employees, capacity_changes))
+                 for week in range(start, end + 1) for emp_idx in team]
+        slots = [slot for slot in slots if slot[2] > 0]
+    if not slots:
+        return genes
+
+    # Share the hours by room - a 40 h/week person takes twice the share of a 20 h/week one
+    # Rounded up so the project still gets finished; never above the slot's room when room is enough
+    total_room = sum(slot[2] for slot in slots)
+    for emp_idx, week, slot_room in slots:
+        genes[(emp_idx, proj_idx, week)] = -(-required_hours * slot_room // total_room)
+    return genes
+
+
+# Function: Creates starting quarter plans
+# Purpose: Makes POP_SIZE random sparse plans - projects are planned in a random order around each other
+def generate_multi_period_population(projects, employees, capacity_changes, project_teams):
+    population = []
+    for _ in range(POP_SIZE):
+        plan = {}
+        # Hours booked so far, so later projects fit around earlier ones
+        booked = {}
+        order = list(range(len(projects)))
+        random.shuffle(order)
+        for proj_idx in order:
+            genes = plan_project(proj_idx, projects, employees, capacity_changes, project_teams, booked)
+            for (emp_idx, _, week), hours in genes.items():
+                booked[(emp_idx, week)] = booked.get((emp_idx, week), 0) + hours
+            plan.update(genes)
+        population.append(plan)
+    return population
+
+
+# Function: Scores a quarter plan (higher is better)
+# Purpose: Same rules as fitness(), but hours are counted per employee PER WEEK
+def fitness_multi_period(plan, projects, employees, capacity_changes, project_teams):
+    total_benefit = 0
+
+    # Hours booked per (employee, week) - only pairs that appear in the plan get an entry
+    week_hours = {}
+    # Hours delivered and team members per project
+    project_hours = {}
+    project_members = {}
+    # Projects with a gene that breaks the rules (wrong skills or outside the window)
+    broken_projects = set()
+
+    # One pass over the genes - cost grows with the number of real assignments
+    for (emp_idx, proj_idx, week), hours in plan.items():
+        project = projects[proj_idx]
+        if emp_idx not in project_teams[proj_idx] or not (project[4] <= week <= project[5]):
+            broken_projects.add(proj_idx)
+        week_hours[(emp_idx, week)] = week_hours.get((emp_idx, week), 0) + hours
+        project_hours[proj_idx] = project_hours.get(proj_idx, 0) + hours
+        project_members.setdefault(proj_idx, set()).add(emp_idx)
+
+    project_scores = {}
+    assigned_projects = set()
+    for proj_idx, project in enumerate(projects):
+        members = project_members.get(proj_idx)
+        # Done if it has a team, no broken genes and enough hours in total
+        if members and proj_idx not in broken_projects and project_hours[proj_idx] >= project[2]:
+            # 20 points * priority, shared by the team - smaller teams score more
+            project_score = 20 * project[3] * (1 / len(members))
+            total_benefit += project_score
+            project_scores[project[0]] = project_score
+            assigned_projects.add(proj_idx)
+        else:
+            project_scores[project[0]] = 0
+
+    # Penalty: Employees with no work in the whole quarter - 100 points each
+    used_employees = {emp_idx for emp_idx, _ in week_hours}
+    total_benefit -= (len(employees) - len(used_employees)) * 100
+
+    # Penalty: Overwork in any week - 50 points per extra hour
+    # Only (employee, week) pairs with work booked are checked
+    over_allocation_penalty = 0
+    for (emp_idx, week), hours in week_hours.items():
+        capacity = weekly_capacity(emp_idx, week, employees, capacity_changes)
+        if hours > capacity:
+            over_allocation_penalty += (hours - capacity) * 50
+    total_benefit -= over_allocation_penalty
+
+    # Penalty: Unfinished projects - 50 points each
+    total_benefit -= (len(projects) - len(assigned_projects)) * 50
+
+    # Total hours booked, capped at each week's capacity so overwork doesn't count as useful time
+    hours_used = sum(min(hours, weekly_capacity(emp_idx, week, employees, capacity_changes))
+                     for (emp_idx, week), hours in week_hours.items())
+
+    # Same four things as fitness(): total score, project scores, projects done, hours used
+    return total_benefit, project_scores, len(assigned_projects), hours_used
+
+
+# Function: Picks top quarter plans for next round
+# Purpose: Same elite + tournament idea as selection(), but every plan is scored only once
+def selection_multi_period(population, elite_size, tournament_size, projects, employees, capacity_changes, project_teams):
+    # Score each plan once and reuse it - quarter plans are bigger, so no re-scoring in tournaments
+    scored = [(fitness_multi_period(plan, projects, employees, capacity_changes, project_teams)[0], plan)
+              for plan in population]
+    scored.sort(key=lambda x: x[0], reverse=True)
+
+    # Keep the elite, then fill up to half the population with tournament winners
+    selected = [plan for _, plan in scored[:elite_size]]
+    for _ in range((POP_SIZE // 2) - elite_size):
+        tournament = random.sample(scored, tournament_size)
+        selected.append(max(tournament, key=lambda x: x[0])[1])
+    return selected
+
+
+# Function: Mixes two quarter plans
+# Purpose: Same single-point crossover as before - projects before the split come from one parent
+def crossover_multi_period(parent1, parent2, num_projects):
+    point = random.randint(1, num_projects - 1)
+    child1 = {gene: hours for gene, hours in parent1.items() if gene[1] < point}
+    child1.update({gene: hours for gene, hours in parent2.items() if gene[1] >= point})
+    child2 = {gene: hours for gene, hours in parent2.items() if gene[1] < point}
+    child2.update({gene: hours for gene, hours in parent1.items() if gene[1] >= point})
+    return child1, child2
+
+
+# Function: Randomly changes a quarter plan
+# Purpose: Two kinds of change - replan a whole project, or move one gene's hours somewhere else
+def mutate_multi_period(plan, mutation_rate, projects, employees, capacity_changes, project_teams):
+    # Big change: throw away one project's schedule and draw a fresh team and weeks for it
+    if random.random() < mutation_rate:
+        idx = random.randint(0, len(projects) - 1)
+        # Drop the old genes for this project, then add new ones
+        plan = {gene: hours for gene, hours in plan.items() if gene[1] != idx}
+        plan.update(plan_project(idx, projects, employees, capacity_changes, project_teams, booked_hours(plan)))
+
+    # Small change: move one (employee, project, week) gene's hours to another week or another person
+    if plan and random.random() < mutation_rate:
+        emp_idx, proj_idx, week = random.choice(list(plan))
+        project = projects[proj_idx]
+        if random.random() < 0.5:
+            # Same person, another week inside the project's window
+            target = (emp_idx, proj_idx, random.randint(project[4], project[5]))
+        else:
+            # Same week, another person who has the skills for this project
+            target = (random.choice(list(project_teams[proj_idx])), proj_idx, week)
+        if target != (emp_idx, proj_idx, week):
+            # Hours add onto the target gene if that person already works there that week
+            plan[target] = plan.get(target, 0) + plan.pop((emp_idx, proj_idx, week))
+    return plan
+
+
+# Function: Runs the genetic algorithm over the whole quarter
+# Purpose: Same loop as genetic_algorithm(), using the sparse multi-period plan
+def genetic_algorithm_multi_period(mutation_rate, generations, elite_size, tournament_size, projects, employees, skill_to_employees, capacity_changes):
+    # Stop early if a project's window doesn't fit inside the quarter (weeks 1 to PLANNING_WEEKS)
+    for project in projects:
+        if not (1 <= project[4] <= project[5] <= PLANNING_WEEKS):
+            raise ValueError(f"{project[0]}: weeks {project[4]}-{project[5]} must be within 1-{PLANNING_WEEKS}")
+
+    # Work out who can do each project once, up front
+    project_teams = create_project_team_mapping(projects, skill_to_employees)
+    population = generate_multi_period_population(projects, employees, capacity_changes, project_teams)
+
+    for _ in range(generations):
+        selected = selection_multi_period(population, elite_size, tournament_size, projects, employees, capacity_changes, project_teams)
+        offspring = []
+        for i in range(0, len(selected), 2):
+            if i + 1 < len(selected):
+                child1, child2 = crossover_multi_period(selected[i], selected[i + 1], len(projects))
+                offspring.append(mutate_multi_period(child1, mutation_rate, projects, employees, capacity_changes, project_teams))
+                offspring.append(mutate_multi_period(child2, mutation_rate, projects, employees, capacity_changes, project_teams))
+        population = selected + offspring
+
+    best_solution = max(population, key=lambda x: fitness_multi_period(x, projects, employees, capacity_changes, project_teams)[0])
+    return best_solution, fitness_multi_period(best_solution, projects, employees, capacity_changes, project_teams)
+
+
+# Function: Displays the best quarter plan
+# Purpose: Shows each project's team and weeks, then each employee's hours week by week
+def print_multi_period_result(scenario, best_plan, best_fitness, project_scores, projects, employees, capacity_changes):
+    print("-" * 100)
+    print("-" * 100)
+    print(f"\n{scenario}:")
+    print("Maximized Benefit:", best_fitness)
+
+    # Group the genes by project and by employee/week in one pass
+    project_members = {}
+    project_weeks = {}
+    project_hours = {}
+    week_hours = {}
+    for (emp_idx, proj_idx, week), hours in best_plan.items():
+        project_members.setdefault(proj_idx, set()).add(emp_idx)
+        project_weeks.setdefault(proj_idx, set()).add(week)
+        project_hours[proj_idx] = project_hours.get(proj_idx, 0) + hours
+        week_hours[(emp_idx, week)] = week_hours.get((emp_idx, week), 0) + hours
+
+    print("\nProject Allocations:")
+    print("-" * 90)
+    print("{:<10} {:<30} {:<15} {:<20} {:<10}".format("Project", "Assigned Employees", "Weeks", "Hours (Done/Need)", "Score"))
+    print("-" * 90)
+    for proj_idx, project in enumerate(projects):
+        employee_names = [employees[emp_idx][1] for emp_idx in sorted(project_members.get(proj_idx, []))]
+        weeks = sorted(project_weeks.get(proj_idx, []))
+        week_range = f"{weeks[0]}-{weeks[-1]}" if weeks else "-"
+        hours = f"{project_hours.get(proj_idx, 0)}/{project[2]}"
+        print("{:<10} {:<30} {:<15} {:<20} {:<10.2f}".format(project[0], ', '.join(employee_names), week_range, hours, project_scores.get(project[0], 0)))
+    print("-" * 90)
+
+    # One column per week; '*' marks a week where the employee is over capacity
+    print("\nEmployee Hours Per Week ('*' = over capacity):")
+    print("-" * (10 + 5 * PLANNING_WEEKS))
+    print("{:<10}".format("Employee") + "".join("{:>5}".format(f"W{week}") for week in range(1, PLANNING_WEEKS + 1)))
+    print("-" * (10 + 5 * PLANNING_WEEKS))
+    for emp_idx, emp in enumerate(employees):
+        cells = []
+        for week in range(1, PLANNING_WEEKS + 1):
+            hours = week_hours.get((emp_idx, week), 0)
+            over = hours > weekly_capacity(emp_idx, week, employees, capacity_changes)
+            cells.append("{:>5}".format(f"{hours}{'*' if over else ''}"))
+        print("{:<10}".format(emp[1]) + "".join(cells))
+    print("-" * (10 + 5 * PLANNING_WEEKS))
+
+
+# Function: Runs the quarter algorithm multiple times and shows average results
+# Purpose: Same recap as summarize_scenario(), but efficiency is measured against the whole quarter
+# - Efficiency (%): Hours used / sum of weekly_capacity over every employee and week
+def summarize_multi_period_scenario(scenario_name, params, projects, employees, skill_map, capacity_changes, runs=3):
+    print(f"\n=== {scenario_name} ===")
+    print(f"Parameters: {params}")
+    print("-" * 80)
+    print("{:<20} {:<15} {:<15} {:<15} {:<15}".format("Run", "Total Benefit", "Projects Done", "Hours Used", "Efficiency (%)"))
+    print("-" * 80)
+
+    results = []
+
+    # Total hours available in the quarter - holidays and part-time weeks included
+    total_hours_available = sum(weekly_capacity(emp_idx, week, employees, capacity_changes)
+                                for emp_idx in range(len(employees))
+                                for week in range(1, PLANNING_WEEKS + 1))
+
+    # Read the settings from the params string, same as summarize_scenario()
+    param_values = [float(x.split('=')[1]) if '=' in x else x for x in params.split(', ')]
+    mutation_rate, generations, elite_size, tournament_size = param_values[3], int(param_values[0]), int(param_values[1]), int(param_values[2])
+
+    for i in range(runs):
+        best_plan, (benefit, proj_scores, projects_done, hours_used) = genetic_algorithm_multi_period(
+            mutation_rate, generations, elite_size, tournament_size, projects, employees, skill_map, capacity_changes
+        )
+        efficiency = (hours_used / total_hours_available) * 100 if total_hours_available > 0 else 0
+        results.append((benefit, projects_done, hours_used, efficiency))
+        print("{:<20} {:<15.2f} {:<15} {:<15} {:<15.2f}".format(f"Run {i+1}", benefit, projects_done, hours_used, efficiency))
+
+    benefits = [r[0] for r in results]
+    avg_benefit = sum(benefits) / runs
+    spread_benefit = max(benefits) - min(benefits)
+    print("-" * 80)
+    print(f"Average Benefit: {avg_benefit:.2f}, Spread: {spread_benefit:.2f}")
+    print("-" * 40)
+    return results
+
+
 # Function: Runs the whole program with different scenarios
 # Purpose: Tests our team plans in different setups - like running experiments to find the best strategy!
 def main():
@@ -655,6 +1026,16 @@ def main():
     print_result("VARIATION 4: 15 PROJECT + 10 EMPLOYEES, MORE MUTATION", best_allocation_v4, best_fitness_v4, project_scores_v4, projects_15, employees_10)
     summarize_scenario("Variation 4 Summary", params_v4, projects_15, employees_10, skill_map_10)
 
+    # Scenario 4: Quarter plan - 15 projects over 13 weeks + 15 employees
+    # Projects have their own week windows and some employees have holidays (CAPACITY_CHANGES)
+    params_q = "GEN=200, ELITE=2, TOURN=5, MUT=0.15"
+    mutation_rate, generations, elite_size, tournament_size = 0.15, 200, 2, 5
+    best_plan_q, (best_fitness_q, project_scores_q, proj_done_q, hours_q) = genetic_algorithm_multi_period(
+        mutation_rate, generations, elite_size, tournament_size, Data.PROJECTS_QUARTER, employees_15, skill_map_15, Data.CAPACITY_CHANGES
+    )
+    print_multi_period_result("SCENARIO 4: 15 PROJECTS OVER 13 WEEKS + 15 EMPLOYEES", best_plan_q, best_fitness_q, project_scores_q, Data.PROJECTS_QUARTER, employees_15, Data.CAPACITY_CHANGES)
+    summarize_multi_period_scenario("Scenario 4 Summary", params_q, Data.PROJECTS_QUARTER, employees_15, skill_map_15, Data.CAPACITY_CHANGES)
+
 # Run the main function when we start the program
 # This line checks if we’re running this file directly - standard Python trick!
 if __name__ == "__main__":